@@ -1,54 +1,216 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
-
-# Function to extract salary range and convert to numeric
-def process_salary(salary_range):
-    # Extract numbers from LPA format
-    numbers = re.findall(r'(\d+(?:\.\d+)?)', str(salary_range))
-    if len(numbers) >= 2:
-        min_salary = float(numbers[0])
-        max_salary = float(numbers[1])
-        avg_salary = (min_salary + max_salary) / 2
-        return pd.Series({'min_salary': min_salary, 'max_salary': max_salary, 'avg_salary': avg_salary})
-    return pd.Series({'min_salary': None, 'max_salary': None, 'avg_salary': None})
-
-# Function to extract years from experience
-def process_experience(exp):
-    numbers = re.findall(r'(\d+(?:\.\d+)?)', str(exp))
-    if len(numbers) >= 2:
-        return (float(numbers[0]) + float(numbers[1])) / 2
-    elif len(numbers) == 1:
-        return float(numbers[0])
-    return None
+import io
 
 # Set page config
 st.set_page_config(page_title="Indian Job Market Analysis", layout="wide", initial_sidebar_state="expanded")
 
+MAX_SCATTER_POINTS = 5000
+
+CATEGORY_COLS = [
+    'Job Location', 'Company Size', 'Job Type',
+    'Remote/Onsite', 'Education Requirement', 'Company Name'
+]
+
 # Load and preprocess data
 @st.cache_data
 def load_data():
-    df = pd.read_csv('./india_job_market_dataset.csv')
+    # Salary/experience parsing, date conversion and skill splitting are done
+    # once at build time by scripts/build_parquet.py
+    df = pd.read_parquet('./india_job_market_dataset.parquet', engine='pyarrow', dtype_backend='pyarrow')
+    
+    # Newest postings first; filtering keeps this order, so views never re-sort
+    df = df.sort_values('Posted_Date', ascending=False, kind='stable', ignore_index=True)
+    
+    # Dictionary-encode the low-cardinality columns used for filtering and grouping,
+    # with categories in sorted order (the Parquet dictionaries are in file order)
+    for col in CATEGORY_COLS:
+        df[col] = df[col].astype('category')
+        df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
     
-    # Process salary data
-    salary_info = df['Salary Range'].apply(process_salary)
-    df = pd.concat([df, salary_info], axis=1)
+    # Downcast numeric columns
+    df['Number of Applicants'] = df['Number of Applicants'].astype('int32')
+    for col in ['min_salary', 'max_salary', 'avg_salary', 'Experience_Years']:
+        df[col] = df[col].astype('float32')
     
-    # Process experience
-    df['Experience_Years'] = df['Experience Required'].apply(process_experience)
+    # Day-resolution posting dates for the date-range filter (avoids building a
+    # Python date object per row with .dt.date on every rerun)
+    df['_posted_day'] = df['Posted_Date'].to_numpy('datetime64[D]')
     
-    # Convert dates
-    df['Posted_Date'] = pd.to_datetime(df['Posted Date'])
-    df['Application_Deadline'] = pd.to_datetime(df['Application Deadline'])
+    # Lowercased text of every searchable field, so a search is a single substring scan
+    df['_search_blob'] = (
+        df['Job Title'].fillna('') + '\x1f' +
+        df['Company Name'].astype('string').fillna('') + '\x1f' +
+        df['Job Location'].astype('string').fillna('') + '\x1f' +
+        df['Skills Required'].fillna('')
+    ).str.lower()
     
-    # Process skills
-    df['Skills_List'] = df['Skills Required'].str.split(',')
+    # Sidebar options; categories are already unique and sorted
+    df.attrs['locations'] = df['Job Location'].cat.categories.tolist()
+    df.attrs['sizes'] = df['Company Size'].cat.categories.tolist()
+    df.attrs['types'] = df['Job Type'].cat.categories.tolist()
     
     return df
 
+# Boolean mask for "series in selected" on a categorical: flag the selected categories
+# once, then look each row's code up in that table (unknown labels are ignored)
+def cat_mask(series, selected):
+    cats = series.cat.categories
+    idx = cats.get_indexer(list(selected))
+    idx = idx[idx >= 0]
+    # One extra (always False) slot at the end catches code -1, i.e. missing values
+    selected_cats = np.zeros(len(cats) + 1, dtype=bool)
+    selected_cats[idx] = True
+    return selected_cats[series.cat.codes.to_numpy()]
+
+# Row positions matching a filter selection
+def filter_index(df, filter_key):
+    selected_locations, selected_sizes, selected_types, start_date, end_date = filter_key
+    posted_day = df['_posted_day'].to_numpy()
+    mask = (posted_day >= np.datetime64(start_date)) & (posted_day <= np.datetime64(end_date))
+    for col, selected in [
+        ('Job Location', selected_locations),
+        ('Company Size', selected_sizes),
+        ('Job Type', selected_types),
+    ]:
+        mask &= cat_mask(df[col], selected)
+    return np.flatnonzero(mask)
+
+# Only the given columns of the rows at positions idx. The filtered selection is
+# never materialized as a whole frame; each consumer pulls the columns it uses.
+def select_rows(df, idx, cols):
+    return pd.DataFrame({col: df[col].take(idx) for col in cols})
+
+# Full rows for the n largest values of col among positions idx (NaN excluded, ties
+# keep the date order, like DataFrame.nlargest)
+def top_rows(df, idx, col, n=10):
+    values = df[col].to_numpy()[idx]
+    order = np.argsort(-values, kind='stable')[:n]
+    order = order[~np.isnan(values[order])]
+    return df.take(idx[order])
+
+# Key metrics over the rows at positions idx (all rows if None), computed in a single
+# pass over each column's NumPy buffer
+def summary_stats(df, idx=None):
+    rows = slice(None) if idx is None else idx
+    return {
+        'n': len(df) if idx is None else len(idx),
+        'sal': np.nanmean(df['avg_salary'].to_numpy()[rows], dtype=np.float64),
+        'exp': np.nanmean(df['Experience_Years'].to_numpy()[rows], dtype=np.float64),
+        'remote': cat_mask(df['Remote/Onsite'], ['Remote'])[rows].mean() * 100,
+    }
+
+# Baseline (unfiltered) metrics only depend on the dataset, so compute them once
+@st.cache_data
+def baseline_stats(_df):
+    return summary_stats(_df)
+
+# Hash aggregation with Arrow's multithreaded group_by over the rows at positions idx.
+# Result columns are named "<column>_<function>" and the frame is indexed and sorted
+# by the key.
+def arrow_group_by(df, idx, key, aggregations):
+    cols = [key] + list(dict.fromkeys(col for col, _ in aggregations))
+    tbl = pa.Table.from_pandas(select_rows(df, idx, cols), preserve_index=False)
+    return tbl.group_by(key).aggregate(aggregations).to_pandas().set_index(key).sort_index()
+
+# Aggregations behind each chart. They are cached on the filter selection
+# (filter_key); the frame and the filtered row positions are passed with a leading
+# underscore so Streamlit does not hash them.
+@st.cache_data
+def agg_salary_by_loc(filter_key, _df, _idx):
+    salary_by_loc = arrow_group_by(
+        _df, _idx, 'Job Location', [('avg_salary', 'mean'), ('avg_salary', 'count')]
+    ).round(2)
+    salary_by_loc.columns = ['Avg Salary', 'Job Count']
+    return salary_by_loc
+
+@st.cache_data
+def agg_skills(filter_key, _df, _idx):
+    # Skills_List is an Arrow list<string> column (trimmed at build time), so it is
+    # flattened once and both skills charts come from a single Arrow group_by:
+    # postings per skill, plus mean and non-null count of the salary
+    skills_arr = pa.array(_df['Skills_List'].array.take(_idx))
+    skill_lengths = pc.list_value_length(skills_arr).fill_null(0).to_numpy()
+    flat = pa.table({
+        'Skill': pc.list_flatten(skills_arr),
+        'avg_salary': pa.array(
+            np.repeat(_df['avg_salary'].to_numpy()[_idx], skill_lengths), from_pandas=True
+        ),
+    })
+    skill_stats = flat.group_by('Skill').aggregate([
+        ('Skill', 'count'), ('avg_salary', 'mean'), ('avg_salary', 'count')
+    ]).to_pandas().set_index('Skill').sort_index()
+    skill_stats = skill_stats[['Skill_count', 'avg_salary_mean', 'avg_salary_count']]
+    skill_stats.columns = ['postings', 'mean', 'count']
+    return skill_stats
+
+@st.cache_data
+def agg_company_metrics(filter_key, _df, _idx):
+    company_metrics = arrow_group_by(
+        _df, _idx, 'Company Size',
+        [('avg_salary', 'mean'), ('Job ID', 'count'), ('Number of Applicants', 'mean')]
+    ).round(2)
+    company_metrics.columns = ['avg_salary', 'Job ID', 'Number of Applicants']
+    return company_metrics
+
+@st.cache_data
+def agg_top_companies(filter_key, _df, _idx):
+    # Pick the 10 busiest companies first so only their rows are aggregated
+    companies = _df['Company Name'].take(_idx)
+    top10 = companies.value_counts().nlargest(10).index
+    sub = select_rows(
+        _df, _idx[cat_mask(companies, top10)],
+        ['Company Name', 'Job ID', 'avg_salary', 'Number of Applicants']
+    )
+    top_companies = sub.groupby('Company Name', observed=True).agg({
+        'Job ID': 'count',
+        'avg_salary': 'mean',
+        'Number of Applicants': 'mean'
+    }).sort_values('Job ID', ascending=False)
+    # The chart colors by company; keep only these companies as categories
+    top_companies.index = top_companies.index.remove_unused_categories()
+    return top_companies
+
+@st.cache_data
+def agg_daily_posts(filter_key, _df, _idx):
+    daily_posts = arrow_group_by(_df, _idx, 'Posted_Date', [('Job ID', 'count')])
+    daily_posts.columns = ['count']
+    return daily_posts.reset_index()
+
+@st.cache_data
+def agg_edu_dist(filter_key, _df, _idx):
+    edu_counts = pc.value_counts(pa.array(_df['Education Requirement'].take(_idx))).flatten()
+    return pd.Series(
+        edu_counts[1].to_numpy(), index=edu_counts[0].to_pylist()
+    ).sort_values(ascending=False)
+
+# CSV export of the search results, written by Arrow's C++ CSV writer. Cached on the
+# filter selection and search term; only the latest few exports are kept, so the
+# cache doesn't grow with every search.
+@st.cache_data(max_entries=4)
+def export_csv(filter_key, search_term, _df, _idx):
+    # Internal helper columns (prefixed with "_") are not part of the export
+    export_cols = [col for col in _df.columns if not col.startswith('_')]
+    tbl = pa.Table.from_pandas(select_rows(_df, _idx, export_cols), preserve_index=False)
+    # The CSV writer has no list support, so write skills as a comma-separated string
+    skills_idx = tbl.schema.get_field_index('Skills_List')
+    tbl = tbl.set_column(skills_idx, 'Skills_List', pc.binary_join(tbl['Skills_List'], ', '))
+    # Dates are midnight timestamps; write them as plain dates like the source CSV
+    for col in ['Posted_Date', 'Application_Deadline']:
+        col_idx = tbl.schema.get_field_index(col)
+        tbl = tbl.set_column(col_idx, col, tbl[col].cast(pa.date32()))
+    # Arrow quotes every string field, unlike pandas which only quotes when needed
+    buf = io.BytesIO()
+    pacsv.write_csv(tbl, buf)
+    return buf.getvalue()
+
 # Load data
 try:
     df = load_data()
@@ -78,35 +240,43 @@ with st.sidebar:
     # Location filter
     selected_locations = st.multiselect(
         "Select Locations",
-        options=sorted(df['Job Location'].unique()),
-        default=sorted(df['Job Location'].unique())[:5]
+        options=df.attrs['locations'],
+        default=df.attrs['locations'][:5]
     )
     
     # Company size filter
     selected_sizes = st.multiselect(
         "Company Size",
-        options=sorted(df['Company Size'].unique()),
-        default=sorted(df['Company Size'].unique())
+        options=df.attrs['sizes'],
+        default=df.attrs['sizes']
     )
     
     # Job type filter
     selected_types = st.multiselect(
         "Job Type",
-        options=sorted(df['Job Type'].unique()),
-        default=sorted(df['Job Type'].unique())
+        options=df.attrs['types'],
+        default=df.attrs['types']
     )
 
-# Apply filters
-mask = (
-    (df['Posted_Date'].dt.date >= date_range[0]) &
-    (df['Posted_Date'].dt.date <= date_range[1]) &
-    (df['Job Location'].isin(selected_locations)) &
-    (df['Company Size'].isin(selected_sizes)) &
-    (df['Job Type'].isin(selected_types))
+# Hashable summary of the current selection, used as the cache key for the
+# filter index and the aggregations
+filter_key = (
+    tuple(sorted(selected_locations)),
+    tuple(sorted(selected_sizes)),
+    tuple(sorted(selected_types)),
+    date_range[0],
+    date_range[1],
 )
-filtered_df = df[mask]
 
-if filtered_df.empty:
+# Apply filters. Only the row positions are kept in session_state, so reruns that
+# don't touch the filters (e.g. typing a search) skip rebuilding the mask.
+cached_filter = st.session_state.get('filter_idx')
+if cached_filter is None or cached_filter[0] != filter_key:
+    cached_filter = (filter_key, filter_index(df, filter_key))
+    st.session_state['filter_idx'] = cached_filter
+filtered_idx = cached_filter[1]
+
+if len(filtered_idx) == 0:
     st.warning("No data available for the selected filters. Please adjust your selection.")
     st.stop()
 st.header("🏆 Job Market Leaderboard")
@@ -114,7 +284,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     # Top Jobs by Number of Applicants
-    top_applicant_jobs = filtered_df.nlargest(10, 'Number of Applicants')
+    top_applicant_jobs = top_rows(df, filtered_idx, 'Number of Applicants')
     st.subheader("Most Competitive Jobs")
     for idx, row in top_applicant_jobs.iterrows():
         st.markdown(f"""
@@ -126,7 +296,7 @@ with col1:
 
 with col2:
     # Top Paying Jobs
-    top_salary_jobs = filtered_df.nlargest(10, 'avg_salary')
+    top_salary_jobs = top_rows(df, filtered_idx, 'avg_salary')
     st.subheader("Highest Paying Jobs")
     for idx, row in top_salary_jobs.iterrows():
         st.markdown(f"""
@@ -138,7 +308,7 @@ with col2:
 
 with col3:
     # Emerging Jobs (Recently Posted High-Demand Jobs)
-    recent_jobs = filtered_df.sort_values('Posted_Date', ascending=False).head(10)
+    recent_jobs = df.take(filtered_idx[:10])
     st.subheader("Emerging Job Opportunities")
     for idx, row in recent_jobs.iterrows():
         st.markdown(f"""
@@ -151,36 +321,35 @@ with col3:
 # Key Metrics
 st.header("📊 Key Metrics")
 col1, col2, col3, col4 = st.columns(4)
+stats = summary_stats(df, filtered_idx)
+bs = baseline_stats(df)
 
 with col1:
     st.metric(
         "Total Jobs",
-        f"{len(filtered_df):,}",
-        f"{len(filtered_df) - len(df[~mask]):+,} from selection"
+        f"{stats['n']:,}",
+        f"{stats['n'] - (bs['n'] - stats['n']):+,} from selection"
     )
 
 with col2:
-    avg_salary = filtered_df['avg_salary'].mean()
     st.metric(
         "Average Salary (LPA)",
-        f"₹{avg_salary:.2f}",
-        f"{(avg_salary - df['avg_salary'].mean()):.2f}"
+        f"₹{stats['sal']:.2f}",
+        f"{(stats['sal'] - bs['sal']):.2f}"
     )
 
 with col3:
-    avg_exp = filtered_df['Experience_Years'].mean()
     st.metric(
         "Avg Experience Required",
-        f"{avg_exp:.1f} years",
-        f"{(avg_exp - df['Experience_Years'].mean()):.1f}"
+        f"{stats['exp']:.1f} years",
+        f"{(stats['exp'] - bs['exp']):.1f}"
     )
 
 with col4:
-    remote_pct = (filtered_df['Remote/Onsite'] == 'Remote').mean() * 100
     st.metric(
         "Remote Jobs",
-        f"{remote_pct:.1f}%",
-        f"{(remote_pct - (df['Remote/Onsite'] == 'Remote').mean() * 100):.1f}%"
+        f"{stats['remote']:.1f}%",
+        f"{(stats['remote'] - bs['remote']):.1f}%"
     )
 
 # Salary Analysis
@@ -188,15 +357,27 @@ st.header("💰 Salary Analysis")
 col1, col2 = st.columns(2)
 
 with col1:
-    # Salary by Experience
+    # Salary by Experience (sampled so the browser never receives more than MAX_SCATTER_POINTS)
+    if len(filtered_idx) > MAX_SCATTER_POINTS:
+        scatter_idx = np.random.default_rng(0).choice(filtered_idx, MAX_SCATTER_POINTS, replace=False)
+    else:
+        scatter_idx = filtered_idx
+    scatter_df = select_rows(df, scatter_idx, [
+        'Experience_Years', 'avg_salary', 'Job Type', 'Number of Applicants',
+        'Job Title', 'Company Name'
+    ])
+    # Plotly groups on the color column without observed=True, so drop job types
+    # that aren't in the selection or it looks them up and fails
+    scatter_df = scatter_df.assign(**{'Job Type': scatter_df['Job Type'].cat.remove_unused_categories()})
     fig_salary_exp = px.scatter(
-        filtered_df,
+        scatter_df,
         x='Experience_Years',
         y='avg_salary',
         color='Job Type',
         size='Number of Applicants',
         hover_data=['Job Title', 'Company Name'],
         title='Salary vs Experience Correlation',
+        render_mode='webgl',
         labels={
             'Experience_Years': 'Years of Experience',
             'avg_salary': 'Average Salary (LPA)',
@@ -207,10 +388,7 @@ with col1:
 
 with col2:
     # Salary by Location
-    salary_by_loc = filtered_df.groupby('Job Location').agg({
-        'avg_salary': ['mean', 'count']
-    }).round(2)
-    salary_by_loc.columns = ['Avg Salary', 'Job Count']
+    salary_by_loc = agg_salary_by_loc(filter_key, df, filtered_idx)
     
     fig_salary_loc = px.bar(
         salary_by_loc.reset_index(),
@@ -228,12 +406,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Top Skills
-    all_skills = [skill.strip() for skills in filtered_df['Skills_List'] for skill in skills]
-    skills_df = pd.DataFrame(all_skills, columns=['Skill']).value_counts().reset_index()
-    skills_df.columns = ['Skill', 'Count']
+    skill_stats = agg_skills(filter_key, df, filtered_idx)
+    skills_df = skill_stats['postings'].nlargest(10).rename('Count').reset_index()
     
     fig_skills = px.bar(
-        skills_df.head(10),
+        skills_df,
         x='Count',
         y='Skill',
         orientation='h',
@@ -244,18 +421,17 @@ with col1:
 
 with col2:
     # Skills by Average Salary
-    skills_salary = filtered_df.explode('Skills_List')
-    skills_salary_avg = skills_salary.groupby('Skills_List')['avg_salary'].agg(['mean', 'count']).round(2)
+    skills_salary_avg = skill_stats[['mean', 'count']].round(2)
     skills_salary_avg = skills_salary_avg[skills_salary_avg['count'] >= 5].sort_values('mean', ascending=False)
     
     fig_skills_salary = px.bar(
         skills_salary_avg.head(10).reset_index(),
-        x='Skills_List',
+        x='Skill',
         y='mean',
         color='count',
         title='Top 10 Highest Paying Skills',
         labels={
-            'Skills_List': 'Skill',
+            'Skill': 'Skill',
             'mean': 'Average Salary (LPA)',
             'count': 'Number of Jobs'
         }
@@ -268,11 +444,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Company Size vs Salary
-    company_metrics = filtered_df.groupby('Company Size').agg({
-        'avg_salary': 'mean',
-        'Job ID': 'count',
-        'Number of Applicants': 'mean'
-    }).round(2)
+    company_metrics = agg_company_metrics(filter_key, df, filtered_idx)
     
     fig_company = go.Figure(data=[
         go.Bar(name='Avg Salary', y=company_metrics['avg_salary']),
@@ -289,11 +461,7 @@ with col1:
 
 with col2:
     # Top Companies by Job Postings
-    top_companies = filtered_df.groupby('Company Name').agg({
-        'Job ID': 'count',
-        'avg_salary': 'mean',
-        'Number of Applicants': 'mean'
-    }).sort_values('Job ID', ascending=False).head(10)
+    top_companies = agg_top_companies(filter_key, df, filtered_idx)
     
     fig_top_companies = px.scatter(
         top_companies.reset_index(),
@@ -316,7 +484,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Time series of job postings
-    daily_posts = filtered_df.groupby('Posted_Date').size().reset_index(name='count')
+    daily_posts = agg_daily_posts(filter_key, df, filtered_idx)
     fig_trends = px.line(
         daily_posts,
         x='Posted_Date',
@@ -328,7 +496,7 @@ with col1:
 
 with col2:
     # Education Requirements
-    edu_dist = filtered_df['Education Requirement'].value_counts()
+    edu_dist = agg_edu_dist(filter_key, df, filtered_idx)
     fig_edu = px.pie(
         values=edu_dist.values,
         names=edu_dist.index,
@@ -338,34 +506,30 @@ with col2:
 
 # Interactive Job Search
 st.header("🔍 Job Search")
-search_cols = ['Job Title', 'Company Name', 'Job Location', 'Skills Required']
 search_term = st.text_input("Search jobs by title, company, location, or skills")
 
 if search_term:
-    search_mask = pd.concat([
-        filtered_df[col].str.contains(search_term, case=False, na=False)
-        for col in search_cols
-    ], axis=1).any(axis=1)
-    search_results = filtered_df[search_mask]
+    search_blob = df['_search_blob'].take(filtered_idx)
+    search_mask = search_blob.str.contains(search_term.lower(), regex=False, na=False)
+    search_idx = filtered_idx[search_mask.to_numpy(dtype=bool)]
 else:
-    search_results = filtered_df
+    search_idx = filtered_idx
 
 # Display results in an interactive table
 st.dataframe(
-    search_results[[
+    select_rows(df, search_idx, [
         'Job Title', 'Company Name', 'Job Location', 'Job Type',
         'Salary Range', 'Experience Required', 'Posted_Date',
         'Remote/Onsite', 'Number of Applicants'
-    ]].sort_values('Posted_Date', ascending=False),
+    ]),
     use_container_width=True,
     height=400
 )
 
 # Download button
-csv = search_results.to_csv(index=False)
 st.download_button(
     label="📥 Download Results as CSV",
-    data=csv,
+    data=export_csv(filter_key, search_term, df, search_idx),
     file_name="job_search_results.csv",
     mime="text/csv"
 )
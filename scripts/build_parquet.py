@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parent.parent
+CSV_PATH = ROOT / 'india_job_market_dataset.csv'
+PARQUET_PATH = ROOT / 'india_job_market_dataset.parquet'
+
+# Named groups are required by Arrow's extract kernel
+LOW = r'(?P<low>\d+(?:\.\d+)?)'
+HIGH = r'(?P<high>\d+(?:\.\d+)?)'
+# "5-8 LPA" -> (5, 8); open-ended ranges like "20+ LPA" have no upper bound and stay NaN
+SALARY_PATTERN = LOW + r'[^\d]+' + HIGH
+# "2-5 years" -> (2, 5); "10+ years" -> (10, NaN)
+EXPERIENCE_PATTERN = LOW + r'(?:[^\d]+' + HIGH + r')?'
+
+# Explicit types for the multithreaded Arrow CSV reader; dates are parsed by the
+# reader itself and low-cardinality columns are dictionary-encoded
+CSV_COLUMN_TYPES = {
+    'Number of Applicants': pa.int32(),
+    'Posted Date': pa.date32(),
+    'Application Deadline': pa.date32(),
+    'Job Location': pa.dictionary(pa.int32(), pa.string()),
+    'Job Type': pa.dictionary(pa.int32(), pa.string()),
+    'Company Name': pa.dictionary(pa.int32(), pa.string()),
+    'Company Size': pa.dictionary(pa.int32(), pa.string()),
+    'Remote/Onsite': pa.dictionary(pa.int32(), pa.string()),
+    'Education Requirement': pa.dictionary(pa.int32(), pa.string()),
+}
+
+def build_dataset():
+    tbl = csv.read_csv(CSV_PATH, convert_options=csv.ConvertOptions(column_types=CSV_COLUMN_TYPES))
+    df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+
+    # Process salary data
+    nums = df['Salary Range'].str.extract(SALARY_PATTERN).astype('float32')
+    df['min_salary'], df['max_salary'] = nums['low'], nums['high']
+    df['avg_salary'] = (nums['low'].to_numpy() + nums['high'].to_numpy()) * 0.5
+
+    # Process experience (midpoint of the range, or the lower bound if open-ended)
+    # (Arrow yields '' rather than null for the unmatched optional upper bound)
+    exp = df['Experience Required'].str.extract(EXPERIENCE_PATTERN).replace('', None).astype('float32')
+    df['Experience_Years'] = ((exp['low'] + exp['high']) * 0.5).fillna(exp['low'])
+
+    # Dates are already parsed; the app works with timestamps
+    df['Posted_Date'] = df['Posted Date'].astype('timestamp[ns][pyarrow]')
+    df['Application_Deadline'] = df['Application Deadline'].astype('timestamp[ns][pyarrow]')
+
+    # Process skills (trimmed here so the app never has to strip per row)
+    df['Skills_List'] = df['Skills Required'].str.strip().str.split(r'\s*,\s*', regex=True)
+
+    return df
+
+def main():
+    df = build_dataset()
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    pq.write_table(
+        table,
+        PARQUET_PATH,
+        compression='zstd',
+        use_dictionary=True,
+        row_group_size=50_000,
+    )
+    print(f"Wrote {table.num_rows:,} rows to {PARQUET_PATH.name}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import datetime
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / 'app.py')
+
+
+def run_app():
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    return at.run()
+
+
+def test_default_selection_renders():
+    at = run_app()
+    assert not at.exception
+    assert at.metric[0].value == '10,105'
+
+
+def test_deselecting_a_job_type_renders():
+    # Plotly colors the scatter by Job Type; unused categories used to raise KeyError
+    at = run_app()
+    at.multiselect[2].set_value(['Contract', 'Internship']).run()
+    assert not at.exception
+
+
+def test_narrow_selection_renders():
+    # Few companies in the selection; unused company categories used to raise KeyError
+    at = run_app()
+    at.multiselect[0].set_value(['Delhi'])
+    at.multiselect[1].set_value(['Small (1-50)'])
+    at.date_input[0].set_value((datetime.date(2025, 1, 20), datetime.date(2025, 1, 20)))
+    at.run()
+    assert not at.exception